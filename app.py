@@ -1,19 +1,138 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import functools
+import importlib.util
+import numpy as np
 import psutil
 import platform
+import math
 import subprocess
 import sys
 import time
 import json
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import os
 import re
+from bisect import bisect_right
+from statistics import fmean
+
+# Multiply by this to convert bytes to GB - cheaper than dividing by a
+# freshly computed 1024**3 at every call site
+_INV_GB = 1.0 / (1 << 30)
+
+# Threshold tables mapping a reading to a discrete health score - one
+# sorted lookup replaces the duplicated if/elif ladders in the checks
+_MEMORY_THRESHOLDS = (70, 80, 90)
+_MEMORY_SCORES = (95, 80, 60, 30)
+_STORAGE_THRESHOLDS = (70, 85, 95)
+_STORAGE_SCORES = (90, 75, 50, 20)
+_TEMP_THRESHOLDS = (60, 70, 80)
+_TEMP_SCORES = (95, 75, 50, 20)
+_CPU_THRESHOLDS = (70, 90)
+_CPU_SCORES = (90, 60, 30)
+
+# Color/emoji/status lookup tables indexed via bisect_right - branchless
+# replacements for the conditional ladders in the update methods
+_WARN_COLORS = ('lightblue', 'orange', 'red')
+_TEMP_COLOR_THRESHOLDS = (70, 80)    # temperature chart and memory pie
+_DISK_COLOR_THRESHOLDS = (70, 85)    # storage usage chart
+_SCORE_COLORS = ('red', 'orange', 'green')
+_SCORE_COLOR_THRESHOLDS = (60, 80)   # component health bars
+_OVERALL_THRESHOLDS = (50, 70, 85)
+_OVERALL_STATUS = (('POOR', '🔴'), ('FAIR', '🟠'), ('GOOD', '🟡'), ('EXCELLENT', '🟢'))
+_STATUS_DESCRIPTIONS = {
+    'POOR': 'Multiple components require immediate attention',
+    'FAIR': 'Some components need attention',
+    'GOOD': 'System is healthy with minor issues',
+    'EXCELLENT': 'System is running optimally',
+}
+_COMPONENT_THRESHOLDS = (60, 80)
+_COMPONENT_EMOJI = ('🔴', '🟡', '🟢')
+
+# Recommendation builders for components whose health falls below 60 -
+# a dict lookup instead of a string-compare chain per component
+_RECS = {
+    'battery': lambda health: f"• Battery: Consider replacement, health at {health:.1f}%\n",
+    'memory': lambda health: "• Memory: High usage detected, consider adding RAM\n",
+    'storage': lambda health: "• Storage: Check disk space and consider cleanup/upgrade\n",
+    'temperature': lambda health: "• Temperature: Check cooling system, clean fans/vents\n",
+    'performance': lambda health: "• Performance: High CPU usage, check for resource-heavy processes\n",
+}
+
+# Risk level to predictions-tree symbol
+_RISK = {'HIGH': '🔴 HIGH', 'MEDIUM': '🟡 MEDIUM', 'LOW': '🟢 LOW'}
+
+# Upper bound on temperature-chart bars pre-allocated at setup
+_MAX_TEMP_SENSORS = 40
+
+# Report separators, built once instead of on every refresh
+_SEP60 = "=" * 60
+_SEP30 = "-" * 30
+
+# Overview rows: (status text, treeview tag) per health band
+_STATUS_THRESHOLDS = (60, 80)
+_STATUS_ROWS = (('⚠ POOR', 'poor'), ('⚠ FAIR', 'fair'), ('✓ GOOD', 'good'))
+
+def _score(value, thresholds, scores):
+    """Look up the health score for a reading in a threshold table"""
+    return scores[bisect_right(thresholds, value)]
+
+def _classify_overall(score):
+    """Classify an overall health score into its (status, emoji) tier"""
+    return _OVERALL_STATUS[bisect_right(_OVERALL_THRESHOLDS, score)]
+
+def _classify_health(arr):
+    """Return the mean of an array of component scores together with its
+    (status, emoji) tier - the mean runs in NumPy C code"""
+    overall = float(arr.mean()) if arr.size else 0.0
+    return overall, _classify_overall(overall)
+
+@dataclass(slots=True)
+class StorageInfo:
+    """Diagnostic results for a single drive"""
+    device: str
+    mountpoint: str
+    filesystem: str
+    total_gb: float
+    used_percent: float
+    health_score: int
+    estimated_age_years: int
+    estimated_remaining_years: int
+    drive_type: str
+
+# Filesystems that correspond to real drives - anything else is a
+# virtual/pseudo mount not worth a disk_usage syscall
+_REAL_FSTYPES = frozenset({
+    'ntfs', 'refs', 'exfat', 'fat32', 'vfat',
+    'ext2', 'ext3', 'ext4', 'xfs', 'btrfs', 'zfs', 'f2fs',
+    'apfs', 'hfs', 'hfs+'
+})
+
+@functools.lru_cache(maxsize=1)
+def get_partitions():
+    """Get real disk partitions (cached - the mount table rarely changes).
+
+    Call get_partitions.cache_clear() to force re-enumeration.
+    """
+    return tuple(
+        p for p in psutil.disk_partitions(all=False)
+        if 'cdrom' not in p.opts and 'removable' not in p.opts
+        and p.fstype.lower() in _REAL_FSTYPES
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_platform_info():
+    """Get static platform details (cached - these never change while running)"""
+    return {
+        'platform': platform.system(),
+        'platform_version': platform.version(),
+        'architecture': platform.architecture()[0],
+        'processor': platform.processor(),
+        'hostname': platform.node()
+    }
 
 class AdvancedDiagnosticGUI:
     def __init__(self, root):
@@ -26,6 +145,24 @@ class AdvancedDiagnosticGUI:
         self.diagnostic_data = {}
         self.health_scores = {}
         self.predictions = {}
+        self._details_cache = {}
+        self._summary_cache = {}
+        self._high_risk_count = 0
+
+        # Cached system values (boot time is refreshed once per scan,
+        # core count never changes while running)
+        self._boot_time = psutil.boot_time()
+        self._cpu_count = psutil.cpu_count()
+        self._cpu_prime_time = time.monotonic()
+
+        # Guards diagnostic_data/health_scores when checks run in parallel
+        self._data_lock = threading.Lock()
+
+        # Throttling state so rapid-fire progress/status updates from the
+        # scan thread don't flood the Tk event queue
+        self._last_progress_value = -1.0
+        self._last_progress_time = 0.0
+        self._last_status = None
         
         # Create GUI
         self.create_widgets()
@@ -61,6 +198,11 @@ class AdvancedDiagnosticGUI:
         self.progress = ttk.Progressbar(control_frame, mode='determinate')
         self.progress.pack(pady=5, fill=tk.X)
         
+        # Rescan drives button
+        self.rescan_button = ttk.Button(control_frame, text="Rescan Drives",
+                                       command=self.rescan_drives)
+        self.rescan_button.pack(pady=5, fill=tk.X)
+
         # Status label
         self.status_label = ttk.Label(control_frame, text="Ready to scan")
         self.status_label.pack(pady=5)
@@ -84,8 +226,10 @@ class AdvancedDiagnosticGUI:
         health_frame = ttk.LabelFrame(control_frame, text="Health Summary", padding="10")
         health_frame.pack(pady=10, fill=tk.X)
         
-        self.health_text = tk.Text(health_frame, height=8, width=30, 
-                                  font=('Courier', 9))
+        # undo=False: these widgets are bulk-rewritten every refresh and
+        # an undo stack would just grow with each rewrite
+        self.health_text = tk.Text(health_frame, height=8, width=30,
+                                  font=('Courier', 9), undo=False)
         self.health_text.pack(fill=tk.BOTH)
         
         # Right panel - Tabbed interface
@@ -107,7 +251,8 @@ class AdvancedDiagnosticGUI:
         sys_frame = ttk.LabelFrame(overview_frame, text="System Information", padding="10")
         sys_frame.pack(fill=tk.X, pady=5)
         
-        self.sys_info_text = tk.Text(sys_frame, height=6, font=('Courier', 9))
+        self.sys_info_text = tk.Text(sys_frame, height=6, font=('Courier', 9),
+                                    undo=False)
         self.sys_info_text.pack(fill=tk.BOTH)
         
         # Component status
@@ -125,6 +270,12 @@ class AdvancedDiagnosticGUI:
         self.status_tree.column('Health', width=80)
         self.status_tree.column('Status', width=100)
         self.status_tree.column('Details', width=200)
+
+        # Row coloring by health band - configured once, applied per row
+        # via the tags= argument at insert time
+        self.status_tree.tag_configure('good', background='#d4f7d4')
+        self.status_tree.tag_configure('fair', background='#fdeec6')
+        self.status_tree.tag_configure('poor', background='#f7d4d4')
         
         # Scrollbar for treeview
         tree_scroll = ttk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.status_tree.yview)
@@ -134,27 +285,154 @@ class AdvancedDiagnosticGUI:
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
     def create_analytics_tab(self):
-        """Create analytics tab with charts"""
+        """Create analytics tab with charts.
+
+        The matplotlib figure is built lazily the first time the tab is
+        selected - importing matplotlib costs hundreds of ms and ~25 MB
+        of RSS that users who never open Analytics shouldn't pay.
+        """
         analytics_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(analytics_frame, text="Analytics")
-        
-        # Create matplotlib figure
-        self.fig, ((self.ax1, self.ax2), (self.ax3, self.ax4)) = plt.subplots(2, 2, figsize=(10, 8))
-        self.fig.suptitle('Hardware Analytics Dashboard', fontsize=14, fontweight='bold')
-        
-        # Create canvas for matplotlib
-        self.canvas = FigureCanvasTkAgg(self.fig, analytics_frame)
+        self.analytics_frame = analytics_frame
+
+        analytics_frame.columnconfigure(0, weight=1)
+        analytics_frame.columnconfigure(1, weight=1)
+        analytics_frame.rowconfigure(0, weight=1)
+        analytics_frame.rowconfigure(1, weight=1)
+
+        # The two bar charts are plain Tk canvases - redrawing a handful
+        # of rectangles is far cheaper than a matplotlib render pass
+        health_frame = ttk.LabelFrame(analytics_frame, text="Component Health Scores", padding="5")
+        health_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5), pady=(0, 5))
+        self.health_canvas = tk.Canvas(health_frame, bg='white', highlightthickness=0)
+        self.health_canvas.pack(fill=tk.BOTH, expand=True)
+
+        storage_frame = ttk.LabelFrame(analytics_frame, text="Storage Usage by Drive", padding="5")
+        storage_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5), pady=(5, 0))
+        self.storage_canvas = tk.Canvas(storage_frame, bg='white', highlightthickness=0)
+        self.storage_canvas.pack(fill=tk.BOTH, expand=True)
+
+        # The canvases report a 1px size while the tab is unmapped, so a
+        # scan finished on another tab lays the bars out wrong; re-run
+        # the layout from the cached scan data whenever the real size
+        # becomes known or changes
+        self.health_canvas.bind('<Configure>', lambda event: self.update_health_chart())
+        self.storage_canvas.bind('<Configure>', lambda event: self.update_storage_chart())
+
+        # Memory pie and temperature charts stay in matplotlib but are
+        # created on first tab selection
+        self.fig = None
+        self.ax2 = None
+        self.ax4 = None
+        self.canvas = None
+
+        # Cached chart artists / canvas item ids - reused across scans so
+        # redraws only move and recolor existing items
+        self._health_bar_items = {}
+        self._storage_bar_items = {}
+        self._temp_bars = None
+        self._temp_bar_labels = None
+
+        self.notebook.bind("<<NotebookTabChanged>>", self.maybe_init_analytics)
+
+    def maybe_init_analytics(self, event=None):
+        """Build the matplotlib charts the first time Analytics is shown"""
+        if self.fig is not None:
+            return
+        if self.notebook.index('current') != self.notebook.index(self.analytics_frame):
+            return
+
+        import matplotlib
+        matplotlib.use("TkAgg")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.fig, (self.ax2, self.ax4) = plt.subplots(2, 1, figsize=(5, 8))
+        self.init_temperature_axes()
+
+        # One layout solve at setup - the renderer-driven bbox pass is a
+        # large fraction of draw time and the layout is stable afterwards
+        self.fig.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(self.fig, self.analytics_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=1, rowspan=2,
+                                        sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Blitting state: the data artists are marked animated so a full
+        # draw renders only the static background, which we cache and
+        # restore under them on every refresh
+        self._pie_artists = None
+        self._chart_bg = None
+        self.canvas.mpl_connect('draw_event', self.on_chart_draw)
         self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Backfill the charts if a scan finished before the tab was opened
+        if self.diagnostic_data:
+            self.update_memory_chart()
+            self.update_temperature_chart()
+            self.redraw_charts()
+
+    def init_temperature_axes(self):
+        """Create the persistent temperature-chart artists once - updates
+        only mutate bar heights, colors, visibility and tick labels"""
+        self._temp_bars = self.ax4.bar(range(_MAX_TEMP_SENSORS),
+                                       [0] * _MAX_TEMP_SENSORS, color='lightblue')
+        for bar in self._temp_bars:
+            bar.set_visible(False)
+            bar.set_animated(True)
+
+        self.ax4.set_title('Temperature Sensors')
+        self.ax4.set_ylabel('Temperature (°C)')
+        self.ax4.set_ylim(0, 110)
+        self.ax4.tick_params(axis='x', rotation=45)
+
+        self.ax4.axhline(y=70, color='orange', linestyle='--', alpha=0.5, label='Warning')
+        self.ax4.axhline(y=80, color='red', linestyle='--', alpha=0.5, label='Critical')
+        self.ax4.legend()
+
+    def on_chart_draw(self, event):
+        """Recapture the chart background after any full draw (including
+        the ones the backend issues on resize), then re-render the
+        animated artists on top - a full draw skips them, so without
+        this the charts would come back blank"""
+        self._chart_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.dynamic_chart_artists():
+            self.fig.draw_artist(artist)
+
+    def dynamic_chart_artists(self):
+        """Yield the animated artists that are blitted over the cached
+        chart background"""
+        if self._pie_artists is not None:
+            wedges, texts, autotexts = self._pie_artists
+            yield from wedges
+            yield from texts
+            yield from autotexts
+        if self._temp_bars is not None:
+            yield from self._temp_bars
+
+    def redraw_charts(self):
+        """Composite the matplotlib charts by blitting the animated
+        artists over the cached background - a full draw happens only
+        when the chart structure changed"""
+        if self._chart_bg is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._chart_bg)
+
+        for artist in self.dynamic_chart_artists():
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
         
     def create_details_tab(self):
         """Create detailed information tab"""
         details_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(details_frame, text="Detailed Report")
         
-        self.details_text = scrolledtext.ScrolledText(details_frame, 
-                                                     font=('Courier', 9), 
-                                                     wrap=tk.WORD)
+        self.details_text = scrolledtext.ScrolledText(details_frame,
+                                                     font=('Courier', 9),
+                                                     wrap=tk.WORD,
+                                                     state='disabled',
+                                                     undo=False)
         self.details_text.pack(fill=tk.BOTH, expand=True)
         
     def create_predictions_tab(self):
@@ -199,6 +477,11 @@ class AdvancedDiagnosticGUI:
                        foreground="white",
                        font=('Arial', 10, 'bold'))
         
+    def rescan_drives(self):
+        """Clear the cached partition list so the next scan re-enumerates drives"""
+        get_partitions.cache_clear()
+        self.status_label.config(text="Drive list will refresh on next scan")
+
     def start_scan(self):
         """Start the diagnostic scan in a separate thread"""
         self.scan_button.config(state='disabled', text='Scanning...')
@@ -209,7 +492,10 @@ class AdvancedDiagnosticGUI:
         self.diagnostic_data = {}
         self.health_scores = {}
         self.predictions = {}
-        
+        self._details_cache = {}
+        self._summary_cache = {}
+        self._high_risk_count = 0
+
         # Start scan thread
         scan_thread = threading.Thread(target=self.run_diagnostics)
         scan_thread.daemon = True
@@ -218,50 +504,70 @@ class AdvancedDiagnosticGUI:
     def run_diagnostics(self):
         """Run all diagnostic tests"""
         try:
-            total_steps = sum(1 for var in self.check_vars.values() if var.get()) + 2
+            # Refresh the cached boot time once so every check reuses
+            # the same value instead of repeating the syscall
+            self._boot_time = psutil.boot_time()
+
+            # Prime the CPU usage counters now so check_performance can
+            # read the delta later - the other checks normally provide
+            # the elapsed time that a blocking interval would have wasted,
+            # and check_performance tops the window up if they finish
+            # too quickly for a meaningful delta
+            psutil.cpu_percent(interval=None)
+            self._cpu_prime_time = time.monotonic()
+
+            checks = {
+                'battery': self.check_battery_health,
+                'memory': self.check_memory_health,
+                'storage': self.check_storage_health,
+                'temperature': self.check_temperatures,
+                'performance': self.check_performance
+            }
+            jobs = {name: check for name, check in checks.items()
+                    if self.check_vars[name].get()}
+
+            # The performance check reads the CPU counters primed above,
+            # which is only meaningful over a window of ~0.1s or more -
+            # running it inside the pool would measure a few milliseconds
+            # and report garbage, so it goes after the other checks
+            perf_check = jobs.pop('performance', None)
+
+            total_steps = len(jobs) + (1 if perf_check else 0) + 2
             current_step = 0
-            
+
             # System info
             self.update_status("Collecting system information...")
             self.get_system_info()
             current_step += 1
             self.update_progress((current_step / total_steps) * 100)
-            
-            # Battery health
-            if self.check_vars['battery'].get():
-                self.update_status("Checking battery health...")
-                self.check_battery_health()
-                current_step += 1
-                self.update_progress((current_step / total_steps) * 100)
-            
-            # Memory analysis
-            if self.check_vars['memory'].get():
-                self.update_status("Analyzing memory...")
-                self.check_memory_health()
-                current_step += 1
-                self.update_progress((current_step / total_steps) * 100)
-            
-            # Storage health
-            if self.check_vars['storage'].get():
-                self.update_status("Checking storage health...")
-                self.check_storage_health()
-                current_step += 1
-                self.update_progress((current_step / total_steps) * 100)
-            
-            # Temperature monitoring
-            if self.check_vars['temperature'].get():
-                self.update_status("Monitoring temperatures...")
-                self.check_temperatures()
-                current_step += 1
-                self.update_progress((current_step / total_steps) * 100)
-            
-            # Performance analysis
-            if self.check_vars['performance'].get():
-                self.update_status("Analyzing performance...")
-                self.check_performance()
+
+            # Run the component checks concurrently - each one is
+            # independent and spends nearly all its time in psutil C calls
+            # that release the GIL, so total latency is the slowest check
+            # rather than the sum of all of them
+            self.update_status("Running component checks...")
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {executor.submit(check): name for name, check in jobs.items()}
+                for future in as_completed(futures):
+                    future.result()
+                    self.update_status(f"Checked {futures[future]}...")
+                    current_step += 1
+                    self.update_progress((current_step / total_steps) * 100)
+
+            if perf_check is not None:
+                perf_check()
+                self.update_status("Checked performance...")
                 current_step += 1
                 self.update_progress((current_step / total_steps) * 100)
-            
+
+            # as_completed fills health_scores in finish order, which
+            # varies between scans - restore the canonical check order so
+            # the overview rows and health bars are stable
+            with self._data_lock:
+                self.health_scores = {name: self.health_scores[name]
+                                      for name in checks
+                                      if name in self.health_scores}
+
             # Generate predictions
             self.update_status("Generating predictions...")
             self.generate_predictions()
@@ -281,23 +587,30 @@ class AdvancedDiagnosticGUI:
     
     def update_status(self, message):
         """Update status label safely from thread"""
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.root.after(0, lambda: self.status_label.config(text=message))
-    
+
     def update_progress(self, value):
         """Update progress bar safely from thread"""
-        self.root.after(0, lambda: setattr(self.progress, 'value', value))
+        # Coalesce rapid updates - skip enqueueing unless the value moved
+        # by at least 1% or 50ms have passed (completion always goes out)
+        now = time.monotonic()
+        if (value < 100
+                and abs(value - self._last_progress_value) < 1
+                and now - self._last_progress_time < 0.05):
+            return
+        self._last_progress_value = value
+        self._last_progress_time = now
+        self.root.after(0, lambda: self.progress.configure(value=value))
     
     def get_system_info(self):
         """Get system information"""
-        self.diagnostic_data['system'] = {
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'architecture': platform.architecture()[0],
-            'processor': platform.processor(),
-            'hostname': platform.node(),
-            'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S"),
-            'uptime_hours': (time.time() - psutil.boot_time()) / 3600
-        }
+        system_info = dict(get_platform_info())
+        system_info['boot_time'] = datetime.fromtimestamp(self._boot_time).strftime("%Y-%m-%d %H:%M:%S")
+        system_info['uptime_hours'] = (time.time() - self._boot_time) / 3600
+        self.diagnostic_data['system'] = system_info
     
     def check_battery_health(self):
         """Check battery health and predict lifespan"""
@@ -309,7 +622,7 @@ class AdvancedDiagnosticGUI:
                 is_plugged = battery.power_plugged
                 
                 # Estimate battery age based on system uptime and usage patterns
-                uptime_days = (time.time() - psutil.boot_time()) / (24 * 3600)
+                uptime_days = (time.time() - self._boot_time) / (24 * 3600)
                 estimated_cycles = max(1, uptime_days / 2)  # Rough estimate
                 
                 # Battery health calculation (simplified model)
@@ -320,26 +633,28 @@ class AdvancedDiagnosticGUI:
                 remaining_cycles = max(0, typical_lifespan_cycles - estimated_cycles)
                 remaining_years = remaining_cycles / (365 / 2)  # Assuming charge every 2 days
                 
-                self.diagnostic_data['battery'] = {
-                    'present': True,
-                    'percent': charge_percent,
-                    'plugged': is_plugged,
-                    'estimated_cycles': int(estimated_cycles),
-                    'health_score': round(health_score, 1),
-                    'remaining_cycles': int(remaining_cycles),
-                    'estimated_remaining_years': round(remaining_years, 1),
-                    'secsleft': getattr(battery, 'secsleft', None)
-                }
-                
-                self.health_scores['battery'] = health_score
-                
+                with self._data_lock:
+                    self.diagnostic_data['battery'] = {
+                        'present': True,
+                        'percent': charge_percent,
+                        'plugged': is_plugged,
+                        'estimated_cycles': int(estimated_cycles),
+                        'health_score': round(health_score, 1),
+                        'remaining_cycles': int(remaining_cycles),
+                        'estimated_remaining_years': round(remaining_years, 1),
+                        'secsleft': battery.secsleft
+                    }
+                    self.health_scores['battery'] = health_score
+
             else:
-                self.diagnostic_data['battery'] = {'present': False}
-                self.health_scores['battery'] = 100  # Desktop PC
-                
+                with self._data_lock:
+                    self.diagnostic_data['battery'] = {'present': False}
+                    self.health_scores['battery'] = 100  # Desktop PC
+
         except Exception as e:
-            self.diagnostic_data['battery'] = {'error': str(e)}
-            self.health_scores['battery'] = 50
+            with self._data_lock:
+                self.diagnostic_data['battery'] = {'error': str(e)}
+                self.health_scores['battery'] = 50
     
     def check_memory_health(self):
         """Check memory health and predict failures"""
@@ -348,18 +663,11 @@ class AdvancedDiagnosticGUI:
             
             # Memory health factors
             usage_percent = memory.percent
-            available_gb = memory.available / (1024**3)
-            total_gb = memory.total / (1024**3)
+            available_gb = memory.available * _INV_GB
+            total_gb = memory.total * _INV_GB
             
             # Health score based on usage patterns and availability
-            if usage_percent > 90:
-                health_score = 30
-            elif usage_percent > 80:
-                health_score = 60
-            elif usage_percent > 70:
-                health_score = 80
-            else:
-                health_score = 95
+            health_score = _score(usage_percent, _MEMORY_THRESHOLDS, _MEMORY_SCORES)
             
             # Estimate RAM age (simplified)
             # Assume newer systems have more RAM
@@ -374,147 +682,171 @@ class AdvancedDiagnosticGUI:
             typical_lifespan = 10
             remaining_years = max(0, typical_lifespan - estimated_age_years)
             
-            self.diagnostic_data['memory'] = {
-                'total_gb': round(total_gb, 2),
-                'available_gb': round(available_gb, 2),
-                'used_percent': usage_percent,
-                'health_score': health_score,
-                'estimated_age_years': estimated_age_years,
-                'estimated_remaining_years': remaining_years
-            }
-            
-            self.health_scores['memory'] = health_score
-            
+            with self._data_lock:
+                self.diagnostic_data['memory'] = {
+                    'total_gb': round(total_gb, 2),
+                    'available_gb': round(available_gb, 2),
+                    'used_percent': usage_percent,
+                    'health_score': health_score,
+                    'estimated_age_years': estimated_age_years,
+                    'estimated_remaining_years': remaining_years
+                }
+                self.health_scores['memory'] = health_score
+
         except Exception as e:
-            self.diagnostic_data['memory'] = {'error': str(e)}
-            self.health_scores['memory'] = 50
+            with self._data_lock:
+                self.diagnostic_data['memory'] = {'error': str(e)}
+                self.health_scores['memory'] = 50
     
     def check_storage_health(self):
         """Check storage health and predict failures"""
         try:
-            storage_data = {}
-            partitions = psutil.disk_partitions()
-            
+            drives = []
+            partitions = get_partitions()
             total_health = []
-            
-            for partition in partitions:
+
+            def get_usage(partition):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    
-                    # Calculate health based on usage
-                    used_percent = (usage.used / usage.total) * 100
-                    
-                    if used_percent > 95:
-                        health_score = 20
-                    elif used_percent > 85:
-                        health_score = 50
-                    elif used_percent > 70:
-                        health_score = 75
-                    else:
-                        health_score = 90
-                    
+                    return psutil.disk_usage(partition.mountpoint)
+                except PermissionError:
+                    return None
+
+            # disk_usage releases the GIL and slow/sleeping drives can take
+            # tens of ms each, so probe all the mountpoints in parallel
+            usages = []
+            if partitions:
+                with ThreadPoolExecutor(max_workers=min(8, len(partitions))) as executor:
+                    usages = list(executor.map(get_usage, partitions))
+
+            probed = [(p, u) for p, u in zip(partitions, usages) if u is not None]
+
+            if probed:
+                # Vectorize the size/percentage/score arithmetic - one
+                # pass over SoA arrays instead of per-partition Python math
+                totals = np.array([u.total for _, u in probed], dtype=np.int64)
+                used = np.array([u.used for _, u in probed], dtype=np.int64)
+                used_pcts = used / totals * 100.0
+                size_gbs = totals * _INV_GB
+                scores = np.asarray(_STORAGE_SCORES)[
+                    np.searchsorted(_STORAGE_THRESHOLDS, used_pcts, side='right')]
+
+                for (partition, _), used_percent, size_gb, health_score in zip(
+                        probed, used_pcts, size_gbs, scores):
+                    health_score = int(health_score)
+
                     # Estimate drive age based on size (rough approximation)
-                    size_gb = usage.total / (1024**3)
                     if size_gb > 1000:  # > 1TB
                         estimated_age = 2
                         typical_lifespan = 8 if 'SSD' in partition.fstype.upper() else 5
                     else:
                         estimated_age = 4
                         typical_lifespan = 10 if 'SSD' in partition.fstype.upper() else 6
-                    
+
                     remaining_years = max(0, typical_lifespan - estimated_age)
-                    
-                    storage_data[partition.device] = {
-                        'mountpoint': partition.mountpoint,
-                        'filesystem': partition.fstype,
-                        'total_gb': round(size_gb, 2),
-                        'used_percent': round(used_percent, 2),
-                        'health_score': health_score,
-                        'estimated_age_years': estimated_age,
-                        'estimated_remaining_years': remaining_years,
-                        'drive_type': 'SSD' if 'nvme' in partition.device.lower() else 'HDD'
-                    }
-                    
+
+                    drives.append(StorageInfo(
+                        device=partition.device,
+                        mountpoint=partition.mountpoint,
+                        filesystem=partition.fstype,
+                        total_gb=round(float(size_gb), 2),
+                        used_percent=round(float(used_percent), 2),
+                        health_score=health_score,
+                        estimated_age_years=estimated_age,
+                        estimated_remaining_years=remaining_years,
+                        drive_type='SSD' if 'nvme' in partition.device.lower() else 'HDD'
+                    ))
+
                     total_health.append(health_score)
-                    
-                except PermissionError:
-                    continue
-            
-            self.diagnostic_data['storage'] = storage_data
-            self.health_scores['storage'] = sum(total_health) / len(total_health) if total_health else 50
-            
+
+            with self._data_lock:
+                self.diagnostic_data['storage'] = drives
+                self.health_scores['storage'] = fmean(total_health) if total_health else 50
+
         except Exception as e:
-            self.diagnostic_data['storage'] = {'error': str(e)}
-            self.health_scores['storage'] = 50
+            # Keep the error text alongside the (empty) drive list so a
+            # failed probe is distinguishable from "no real drives found"
+            with self._data_lock:
+                self.diagnostic_data['storage'] = []
+                self.diagnostic_data['storage_error'] = str(e)
+                self.health_scores['storage'] = 50
     
     def check_temperatures(self):
         """Check system temperatures"""
         try:
             temps = psutil.sensors_temperatures()
             temp_data = {}
-            health_scores = []
-            
+            mean_score = 85
+
             if temps:
-                for name, entries in temps.items():
-                    for entry in entries:
-                        current_temp = entry.current
-                        
-                        # Health based on temperature
-                        if current_temp > 80:
-                            health_score = 20
-                        elif current_temp > 70:
-                            health_score = 50
-                        elif current_temp > 60:
-                            health_score = 75
-                        else:
-                            health_score = 95
-                        
-                        temp_data[f"{name}_{entry.label}"] = {
-                            'current': current_temp,
+                entries = [(f"{name}_{entry.label}", entry)
+                           for name, sensor_entries in temps.items()
+                           for entry in sensor_entries]
+
+                if entries:
+                    # Score every sensor in one vectorized pass - modern
+                    # systems can expose 30+ entries across coretemp,
+                    # acpi, nvme etc.
+                    currents = np.fromiter((entry.current for _, entry in entries),
+                                           dtype=np.float32, count=len(entries))
+                    scores = np.asarray(_TEMP_SCORES)[
+                        np.searchsorted(_TEMP_THRESHOLDS, currents, side='right')]
+
+                    for (key, entry), health_score in zip(entries, scores):
+                        temp_data[key] = {
+                            'current': entry.current,
                             'high': entry.high,
                             'critical': entry.critical,
-                            'health_score': health_score
+                            'health_score': int(health_score)
                         }
-                        health_scores.append(health_score)
-            
-            self.diagnostic_data['temperature'] = temp_data
-            self.health_scores['temperature'] = sum(health_scores) / len(health_scores) if health_scores else 85
-            
+                    mean_score = float(scores.mean())
+
+            with self._data_lock:
+                self.diagnostic_data['temperature'] = temp_data
+                self.health_scores['temperature'] = mean_score
+
         except Exception as e:
-            self.diagnostic_data['temperature'] = {'error': str(e)}
-            self.health_scores['temperature'] = 85
+            with self._data_lock:
+                self.diagnostic_data['temperature'] = {'error': str(e)}
+                self.health_scores['temperature'] = 85
     
     def check_performance(self):
         """Check overall system performance"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # The counters were primed at the start of run_diagnostics;
+            # psutil needs ~0.1s between prime and read for a meaningful
+            # delta, and on systems where the other checks finish in a few
+            # ms (no battery, no sensors, cached partition list) the
+            # window must be topped up or the reading is always 0.0
+            elapsed = time.monotonic() - self._cpu_prime_time
+            if elapsed < 0.25:
+                time.sleep(0.25 - elapsed)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_freq = psutil.cpu_freq()
             
             # Performance health
-            if cpu_percent > 90:
-                perf_health = 30
-            elif cpu_percent > 70:
-                perf_health = 60
-            else:
-                perf_health = 90
-            
-            self.diagnostic_data['performance'] = {
-                'cpu_usage': cpu_percent,
-                'cpu_frequency': cpu_freq.current if cpu_freq else None,
-                'cpu_cores': psutil.cpu_count(),
-                'health_score': perf_health
-            }
-            
-            self.health_scores['performance'] = perf_health
+            perf_health = _score(cpu_percent, _CPU_THRESHOLDS, _CPU_SCORES)
             
+            with self._data_lock:
+                self.diagnostic_data['performance'] = {
+                    'cpu_usage': cpu_percent,
+                    'cpu_frequency': cpu_freq.current if cpu_freq else None,
+                    'cpu_cores': self._cpu_count,
+                    'health_score': perf_health
+                }
+                self.health_scores['performance'] = perf_health
+
         except Exception as e:
-            self.diagnostic_data['performance'] = {'error': str(e)}
-            self.health_scores['performance'] = 70
+            with self._data_lock:
+                self.diagnostic_data['performance'] = {'error': str(e)}
+                self.health_scores['performance'] = 70
     
     def generate_predictions(self):
         """Generate failure predictions and lifespan estimates"""
         self.predictions = {}
-        
+        # Counted here while the predictions are assembled so no refresh
+        # has to re-scan them
+        high_risk = 0
+
         # Battery predictions
         if 'battery' in self.diagnostic_data and self.diagnostic_data['battery'].get('present'):
             battery_data = self.diagnostic_data['battery']
@@ -536,7 +868,9 @@ class AdvancedDiagnosticGUI:
                 'remaining_life': time_to_failure,
                 'risk_level': risk_level
             }
-        
+            if risk_level == "HIGH":
+                high_risk += 1
+
         # Memory predictions
         if 'memory' in self.diagnostic_data:
             mem_data = self.diagnostic_data['memory']
@@ -556,31 +890,52 @@ class AdvancedDiagnosticGUI:
                 'remaining_life': f"{remaining:.1f} years",
                 'risk_level': risk_level
             }
-        
+            if risk_level == "HIGH":
+                high_risk += 1
+
         # Storage predictions
-        if 'storage' in self.diagnostic_data:
-            for device, storage_data in self.diagnostic_data['storage'].items():
-                if isinstance(storage_data, dict) and 'health_score' in storage_data:
-                    age = storage_data.get('estimated_age_years', 0)
-                    remaining = storage_data.get('estimated_remaining_years', 0)
-                    drive_type = storage_data.get('drive_type', 'HDD')
-                    
-                    if remaining < 1:
-                        risk_level = "HIGH"
-                    elif remaining < 2:
-                        risk_level = "MEDIUM"
-                    else:
-                        risk_level = "LOW"
-                    
-                    self.predictions[f'Storage ({device})'] = {
-                        'current_age': f"{age} years",
-                        'estimated_lifespan': f"{'8-10' if drive_type == 'SSD' else '5-7'} years",
-                        'remaining_life': f"{remaining:.1f} years",
-                        'risk_level': risk_level
-                    }
-    
+        for drive in self.diagnostic_data.get('storage', []):
+            remaining = drive.estimated_remaining_years
+
+            if remaining < 1:
+                risk_level = "HIGH"
+            elif remaining < 2:
+                risk_level = "MEDIUM"
+            else:
+                risk_level = "LOW"
+
+            self.predictions[f'Storage ({drive.device})'] = {
+                'current_age': f"{drive.estimated_age_years} years",
+                'estimated_lifespan': f"{'8-10' if drive.drive_type == 'SSD' else '5-7'} years",
+                'remaining_life': f"{remaining:.1f} years",
+                'risk_level': risk_level
+            }
+            if risk_level == "HIGH":
+                high_risk += 1
+
+        self._high_risk_count = high_risk
+
+    def refresh_summary_cache(self):
+        """Compute the values shared by the update methods once per
+        refresh - overall score, its classification, the sorted component
+        list and the high-risk count"""
+        cache = {}
+
+        if self.health_scores:
+            scores = np.fromiter(self.health_scores.values(), dtype=np.float64,
+                                 count=len(self.health_scores))
+            overall_health, status = _classify_health(scores)
+
+            cache['overall_health'] = overall_health
+            cache['status'] = status
+            cache['sorted_components'] = sorted(self.health_scores.items())
+            cache['high_risk'] = self._high_risk_count
+
+        self._summary_cache = cache
+
     def update_all_displays(self):
         """Update all GUI displays with diagnostic data"""
+        self.refresh_summary_cache()
         self.root.after(0, self.update_overview)
         self.root.after(0, self.update_analytics)
         self.root.after(0, self.update_details)
@@ -602,35 +957,31 @@ Uptime: {sys_info.get('uptime_hours', 0):.1f} hours"""
         self.sys_info_text.delete(1.0, tk.END)
         self.sys_info_text.insert(1.0, info_text)
         
-        # Component status tree
-        for item in self.status_tree.get_children():
-            self.status_tree.delete(item)
-        
+        # Component status tree - clear in one call instead of per-item deletes
+        children = self.status_tree.get_children()
+        if children:
+            self.status_tree.delete(*children)
+
         for component, health_score in self.health_scores.items():
-            if health_score >= 80:
-                status = "GOOD"
-                status_color = "green"
-            elif health_score >= 60:
-                status = "FAIR"
-                status_color = "orange"
-            else:
-                status = "POOR"
-                status_color = "red"
-            
+            status, tag = _STATUS_ROWS[bisect_right(_STATUS_THRESHOLDS, health_score)]
             details = self.get_component_details(component)
-            
-            item = self.status_tree.insert('', 'end', text=component.title(), 
-                                         values=(f"{health_score:.1f}%", status, details))
-            
-            if status == "POOR":
-                self.status_tree.set(item, 'Status', f"⚠ {status}")
-            elif status == "FAIR":
-                self.status_tree.set(item, 'Status', f"⚠ {status}")
-            else:
-                self.status_tree.set(item, 'Status', f"✓ {status}")
+
+            # Single insert with the final values and row tag - no
+            # follow-up .set() calls
+            self.status_tree.insert('', 'end', text=component.title(),
+                                   values=(f"{health_score:.1f}%", status, details),
+                                   tags=(tag,))
     
     def get_component_details(self, component):
-        """Get summary details for component"""
+        """Get summary details for a component, cached until the next scan"""
+        details = self._details_cache.get(component)
+        if details is None:
+            details = self.build_component_details(component)
+            self._details_cache[component] = details
+        return details
+
+    def build_component_details(self, component):
+        """Format the summary line for a component"""
         data = self.diagnostic_data.get(component, {})
         
         if component == 'battery':
@@ -641,11 +992,12 @@ Uptime: {sys_info.get('uptime_hours', 0):.1f} hours"""
         elif component == 'memory':
             return f"{data.get('used_percent', 0):.0f}% used, {data.get('available_gb', 0):.1f}GB free"
         elif component == 'storage':
-            if isinstance(data, dict) and data:
-                first_drive = next(iter(data.values()))
-                if isinstance(first_drive, dict):
-                    return f"{first_drive.get('used_percent', 0):.0f}% used"
-            return "Multiple drives detected"
+            if data:
+                return f"{data[0].used_percent:.0f}% used"
+            error = self.diagnostic_data.get('storage_error')
+            if error:
+                return f"Error: {error}"
+            return "No drives detected"
         elif component == 'temperature':
             if isinstance(data, dict) and data:
                 temps = [entry.get('current', 0) for entry in data.values() if isinstance(entry, dict)]
@@ -659,268 +1011,423 @@ Uptime: {sys_info.get('uptime_hours', 0):.1f} hours"""
     
     def update_analytics(self):
         """Update analytics charts"""
-        for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
-            ax.clear()
-        
+        self.update_health_chart()
+        self.update_storage_chart()
+
+        # The matplotlib charts only exist once the tab has been opened;
+        # maybe_init_analytics backfills them on first selection
+        if self.fig is None:
+            return
+
+        self.update_memory_chart()
+        self.update_temperature_chart()
+        self.redraw_charts()
+
+    def update_health_chart(self):
+        """Update the component health bar chart"""
         components = list(self.health_scores.keys())
         scores = list(self.health_scores.values())
-        colors = ['red' if s < 60 else 'orange' if s < 80 else 'green' for s in scores]
-        
-        self.ax1.bar(components, scores, color=colors)
-        self.ax1.set_title('Component Health Scores')
-        self.ax1.set_ylabel('Health Score (%)')
-        self.ax1.set_ylim(0, 100)
-        self.ax1.tick_params(axis='x', rotation=45)
-        
-        if 'memory' in self.diagnostic_data:
-            mem_data = self.diagnostic_data['memory']
-            used = mem_data.get('used_percent', 0)
-            free = 100 - used
-            
-            self.ax2.pie([used, free], labels=['Used', 'Free'], autopct='%1.1f%%',
-                        colors=['red' if used > 80 else 'orange' if used > 70 else 'lightblue', 'lightgreen'])
+        colors = [_SCORE_COLORS[bisect_right(_SCORE_COLOR_THRESHOLDS, s)] for s in scores]
+
+        self.draw_vertical_bars(self.health_canvas, self._health_bar_items,
+                               components, scores, colors)
+
+    def draw_vertical_bars(self, canvas, items, labels, values, colors, max_value=100):
+        """Draw labelled vertical bars on a Tk canvas, reusing the canvas
+        item ids across redraws so refreshes allocate nothing"""
+        if not labels:
+            return
+
+        width = max(canvas.winfo_width(), 120)
+        height = max(canvas.winfo_height(), 120)
+        margin = 25
+        slot = (width - 2 * margin) / len(labels)
+        bar_width = slot * 0.6
+
+        if items.get('labels') != labels:
+            canvas.delete('all')
+            items.clear()
+            items['labels'] = list(labels)
+            items['bars'] = [canvas.create_rectangle(0, 0, 0, 0, outline='')
+                             for _ in labels]
+            items['names'] = [canvas.create_text(0, 0, text=label.title(),
+                                                font=('Arial', 8), anchor=tk.N)
+                              for label in labels]
+            items['values'] = [canvas.create_text(0, 0, text='',
+                                                 font=('Arial', 8), anchor=tk.S)
+                               for _ in labels]
+
+        for i, (value, color) in enumerate(zip(values, colors)):
+            x0 = margin + i * slot + (slot - bar_width) / 2
+            x1 = x0 + bar_width
+            y1 = height - margin
+            y0 = y1 - (value / max_value) * (height - 2 * margin)
+            canvas.coords(items['bars'][i], x0, y0, x1, y1)
+            canvas.itemconfig(items['bars'][i], fill=color)
+            canvas.coords(items['names'][i], (x0 + x1) / 2, y1 + 4)
+            canvas.coords(items['values'][i], (x0 + x1) / 2, y0 - 2)
+            canvas.itemconfig(items['values'][i], text=f"{value:.0f}")
+
+    def update_memory_chart(self):
+        """Update the memory usage pie chart"""
+        mem_data = self.diagnostic_data.get('memory')
+        if not mem_data:
+            # Memory was deselected this scan - hide the previous scan's
+            # wedges instead of leaving them blitted on screen
+            if self._pie_artists is not None:
+                wedges, texts, autotexts = self._pie_artists
+                for artist in (*wedges, *texts, *autotexts):
+                    artist.set_visible(False)
+                self._chart_bg = None
+            return
+
+        used = mem_data.get('used_percent', 0)
+        free = 100 - used
+        used_color = _WARN_COLORS[bisect_right(_TEMP_COLOR_THRESHOLDS, used)]
+
+        if self._pie_artists is None:
+            wedges, texts, autotexts = self.ax2.pie(
+                [used, free], labels=['Used', 'Free'], autopct='%1.1f%%',
+                colors=[used_color, 'lightgreen'])
             self.ax2.set_title('Memory Usage')
-        
-        if 'storage' in self.diagnostic_data:
-            storage_data = self.diagnostic_data['storage']
-            devices = []
-            usage_pcts = []
-            
-            for device, data in storage_data.items():
-                if isinstance(data, dict) and 'used_percent' in data:
-                    devices.append(device.replace('\\', ''))
-                    usage_pcts.append(data['used_percent'])
-            
-            if devices:
-                colors = ['red' if u > 85 else 'orange' if u > 70 else 'lightblue' for u in usage_pcts]
-                self.ax3.barh(devices, usage_pcts, color=colors)
-                self.ax3.set_title('Storage Usage by Drive')
-                self.ax3.set_xlabel('Usage (%)')
-                self.ax3.set_xlim(0, 100)
-        
-        if 'temperature' in self.diagnostic_data:
-            temp_data = self.diagnostic_data['temperature']
-            if temp_data and not temp_data.get('error'):
-                temp_names = []
-                temp_values = []
-                
-                for name, data in temp_data.items():
-                    if isinstance(data, dict) and 'current' in data:
-                        temp_names.append(name.split('_')[-1])
-                        temp_values.append(data['current'])
-                
-                if temp_names:
-                    colors = ['red' if t > 80 else 'orange' if t > 70 else 'lightblue' for t in temp_values]
-                    self.ax4.bar(temp_names, temp_values, color=colors)
-                    self.ax4.set_title('Temperature Sensors')
-                    self.ax4.set_ylabel('Temperature (°C)')
-                    self.ax4.tick_params(axis='x', rotation=45)
-                    
-                    self.ax4.axhline(y=70, color='orange', linestyle='--', alpha=0.5, label='Warning')
-                    self.ax4.axhline(y=80, color='red', linestyle='--', alpha=0.5, label='Critical')
-                    self.ax4.legend()
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
-    
+
+            for artist in (*wedges, *texts, *autotexts):
+                artist.set_animated(True)
+            self._pie_artists = (wedges, texts, autotexts)
+            self._chart_bg = None
+            return
+
+        # Rotate the existing wedges in place and move their labels to
+        # the new mid-angles - no artists are created per refresh
+        wedges, texts, autotexts = self._pie_artists
+        split = used * 3.6
+        wedges[0].set_theta1(0)
+        wedges[0].set_theta2(split)
+        wedges[0].set_facecolor(used_color)
+        wedges[1].set_theta1(split)
+        wedges[1].set_theta2(360)
+
+        for wedge, text, autotext, pct in zip(wedges, texts, autotexts, (used, free)):
+            mid = math.radians((wedge.theta1 + wedge.theta2) / 2)
+            text.set_position((1.1 * math.cos(mid), 1.1 * math.sin(mid)))
+            autotext.set_position((0.6 * math.cos(mid), 0.6 * math.sin(mid)))
+            autotext.set_text(f'{pct:.1f}%')
+            # Re-show artists hidden while memory was deselected
+            wedge.set_visible(True)
+            text.set_visible(True)
+            autotext.set_visible(True)
+
+    def update_storage_chart(self):
+        """Update the storage usage chart"""
+        drives = self.diagnostic_data.get('storage') or []
+        devices = [drive.device.replace('\\', '') for drive in drives]
+        usage_pcts = [drive.used_percent for drive in drives]
+
+        if not devices:
+            # Storage deselected or no drives found - clear any bars left
+            # over from the previous scan
+            if self._storage_bar_items:
+                self.storage_canvas.delete('all')
+                self._storage_bar_items.clear()
+            return
+
+        colors = [_WARN_COLORS[bisect_right(_DISK_COLOR_THRESHOLDS, u)] for u in usage_pcts]
+
+        self.draw_horizontal_bars(self.storage_canvas, self._storage_bar_items,
+                                 devices, usage_pcts, colors)
+
+    def draw_horizontal_bars(self, canvas, items, labels, values, colors, max_value=100):
+        """Draw labelled horizontal bars on a Tk canvas, reusing the
+        canvas item ids across redraws"""
+        if not labels:
+            return
+
+        width = max(canvas.winfo_width(), 120)
+        height = max(canvas.winfo_height(), 120)
+        margin = 15
+        label_width = 80
+        slot = (height - 2 * margin) / len(labels)
+        bar_height = slot * 0.6
+
+        if items.get('labels') != labels:
+            canvas.delete('all')
+            items.clear()
+            items['labels'] = list(labels)
+            items['bars'] = [canvas.create_rectangle(0, 0, 0, 0, outline='')
+                             for _ in labels]
+            items['names'] = [canvas.create_text(0, 0, text=label,
+                                                font=('Arial', 8), anchor=tk.E)
+                              for label in labels]
+            items['values'] = [canvas.create_text(0, 0, text='',
+                                                 font=('Arial', 8), anchor=tk.W)
+                               for _ in labels]
+
+        for i, (value, color) in enumerate(zip(values, colors)):
+            y0 = margin + i * slot + (slot - bar_height) / 2
+            y1 = y0 + bar_height
+            x0 = margin + label_width
+            x1 = x0 + (value / max_value) * (width - x0 - margin - 35)
+            canvas.coords(items['bars'][i], x0, y0, x1, y1)
+            canvas.itemconfig(items['bars'][i], fill=color)
+            canvas.coords(items['names'][i], x0 - 5, (y0 + y1) / 2)
+            canvas.coords(items['values'][i], x1 + 4, (y0 + y1) / 2)
+            canvas.itemconfig(items['values'][i], text=f"{value:.0f}%")
+
+    def update_temperature_chart(self):
+        """Update the temperature sensors chart"""
+        temp_data = self.diagnostic_data.get('temperature')
+        if not temp_data or temp_data.get('error'):
+            self.hide_temperature_bars()
+            return
+
+        temp_names = []
+        temp_values = []
+
+        for name, data in temp_data.items():
+            if isinstance(data, dict) and 'current' in data:
+                temp_names.append(name.split('_')[-1])
+                temp_values.append(data['current'])
+
+        if not temp_names:
+            self.hide_temperature_bars()
+            return
+
+        # Cap at the pre-allocated bar count
+        temp_names = temp_names[:_MAX_TEMP_SENSORS]
+        temp_values = temp_values[:_MAX_TEMP_SENSORS]
+
+        # One C-level binary search over all sensors instead of a Python
+        # lookup per element
+        indices = np.searchsorted(_TEMP_COLOR_THRESHOLDS,
+                                  np.asarray(temp_values), side='right')
+        colors = np.asarray(_WARN_COLORS)[indices].tolist()
+
+        for bar, value, color in zip(self._temp_bars, temp_values, colors):
+            bar.set_height(value)
+            bar.set_facecolor(color)
+            bar.set_visible(True)
+        for bar in self._temp_bars[len(temp_values):]:
+            bar.set_visible(False)
+
+        if self._temp_bar_labels != temp_names:
+            # Tick labels are part of the cached background, so a changed
+            # sensor set forces one background redraw
+            self.ax4.set_xticks(range(len(temp_names)))
+            self.ax4.set_xticklabels(temp_names)
+            self.ax4.set_xlim(-0.6, len(temp_names) - 0.4)
+            self._temp_bar_labels = temp_names
+            self._chart_bg = None
+
+    def hide_temperature_bars(self):
+        """Hide all temperature bars when the check was deselected or
+        returned nothing, so a previous scan's bars don't stay on screen"""
+        if not self._temp_bar_labels:
+            return
+        for bar in self._temp_bars:
+            bar.set_visible(False)
+        self.ax4.set_xticks([])
+        self._temp_bar_labels = None
+        self._chart_bg = None
+
     def update_details(self):
         """Update detailed report tab"""
-        report = "="*60 + "\n"
-        report += "DETAILED HARDWARE DIAGNOSTIC REPORT\n"
-        report += "="*60 + "\n\n"
-        
-        report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        if 'system' in self.diagnostic_data:
-            sys_data = self.diagnostic_data['system']
-            report += "SYSTEM INFORMATION:\n"
-            report += "-" * 30 + "\n"
-            for key, value in sys_data.items():
-                report += f"{key.replace('_', ' ').title()}: {value}\n"
-            report += "\n"
-        
-        if 'battery' in self.diagnostic_data:
-            battery_data = self.diagnostic_data['battery']
-            report += "BATTERY ANALYSIS:\n"
-            report += "-" * 30 + "\n"
-            if battery_data.get('present'):
-                report += f"Current Charge: {battery_data.get('percent', 0):.1f}%\n"
-                report += f"Power Plugged: {'Yes' if battery_data.get('plugged') else 'No'}\n"
-                report += f"Estimated Cycles: {battery_data.get('estimated_cycles', 0)}\n"
-                report += f"Health Score: {battery_data.get('health_score', 0):.1f}%\n"
-                report += f"Estimated Remaining Years: {battery_data.get('estimated_remaining_years', 0):.1f}\n"
-                
-                if battery_data.get('secsleft'):
-                    hours = battery_data['secsleft'] // 3600
-                    minutes = (battery_data['secsleft'] % 3600) // 60
-                    report += f"Time Remaining: {hours}h {minutes}m\n"
+        # Collect the report as a list of fragments and join once at the
+        # end - repeated += reallocates the whole string each time
+        parts = []
+        append = parts.append
+
+        append(f"{_SEP60}\n")
+        append("DETAILED HARDWARE DIAGNOSTIC REPORT\n")
+        append(f"{_SEP60}\n\n")
+
+        # time.strftime skips the datetime object construction that
+        # datetime.now().strftime pays on every refresh
+        append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        # Bind the data dict and per-section .get methods to locals once -
+        # this method re-reads dozens of fields per refresh
+        dd = self.diagnostic_data
+
+        sys_data = dd.get('system')
+        if sys_data is not None:
+            append("SYSTEM INFORMATION:\n")
+            append(f"{_SEP30}\n")
+            parts.extend(f"{key.replace('_', ' ').title()}: {value}\n"
+                         for key, value in sys_data.items())
+            append("\n")
+
+        battery_data = dd.get('battery')
+        if battery_data is not None:
+            bg = battery_data.get
+            append("BATTERY ANALYSIS:\n")
+            append(f"{_SEP30}\n")
+            if bg('present'):
+                append(
+                    f"Current Charge: {bg('percent', 0):.1f}%\n"
+                    f"Power Plugged: {'Yes' if bg('plugged') else 'No'}\n"
+                    f"Estimated Cycles: {bg('estimated_cycles', 0)}\n"
+                    f"Health Score: {bg('health_score', 0):.1f}%\n"
+                    f"Estimated Remaining Years: {bg('estimated_remaining_years', 0):.1f}\n"
+                )
+
+                secsleft = bg('secsleft')
+                if secsleft:
+                    hours, rem = divmod(secsleft, 3600)
+                    minutes = rem // 60
+                    append(f"Time Remaining: {hours}h {minutes}m\n")
             else:
-                report += "No battery detected (Desktop system)\n"
-            report += "\n"
-        
-        if 'memory' in self.diagnostic_data:
-            mem_data = self.diagnostic_data['memory']
-            report += "MEMORY ANALYSIS:\n"
-            report += "-" * 30 + "\n"
-            report += f"Total RAM: {mem_data.get('total_gb', 0):.2f} GB\n"
-            report += f"Available RAM: {mem_data.get('available_gb', 0):.2f} GB\n"
-            report += f"Used Percentage: {mem_data.get('used_percent', 0):.1f}%\n"
-            report += f"Health Score: {mem_data.get('health_score', 0):.1f}%\n"
-            report += f"Estimated Age: {mem_data.get('estimated_age_years', 0)} years\n"
-            report += f"Estimated Remaining Life: {mem_data.get('estimated_remaining_years', 0):.1f} years\n"
-            report += "\n"
-        
-        if 'storage' in self.diagnostic_data:
-            storage_data = self.diagnostic_data['storage']
-            report += "STORAGE ANALYSIS:\n"
-            report += "-" * 30 + "\n"
-            for device, data in storage_data.items():
-                if isinstance(data, dict) and 'total_gb' in data:
-                    report += f"Device: {device}\n"
-                    report += f"  Mount Point: {data.get('mountpoint', 'N/A')}\n"
-                    report += f"  File System: {data.get('filesystem', 'N/A')}\n"
-                    report += f"  Total Size: {data.get('total_gb', 0):.2f} GB\n"
-                    report += f"  Used: {data.get('used_percent', 0):.1f}%\n"
-                    report += f"  Drive Type: {data.get('drive_type', 'Unknown')}\n"
-                    report += f"  Health Score: {data.get('health_score', 0):.1f}%\n"
-                    report += f"  Estimated Age: {data.get('estimated_age_years', 0)} years\n"
-                    report += f"  Est. Remaining Life: {data.get('estimated_remaining_years', 0):.1f} years\n"
-                    report += "\n"
-        
-        if 'temperature' in self.diagnostic_data:
-            temp_data = self.diagnostic_data['temperature']
-            report += "TEMPERATURE MONITORING:\n"
-            report += "-" * 30 + "\n"
+                append("No battery detected (Desktop system)\n")
+            append("\n")
+
+        mem_data = dd.get('memory')
+        if mem_data is not None:
+            mg = mem_data.get
+            append("MEMORY ANALYSIS:\n")
+            append(f"{_SEP30}\n")
+            append(
+                f"Total RAM: {mg('total_gb', 0):.2f} GB\n"
+                f"Available RAM: {mg('available_gb', 0):.2f} GB\n"
+                f"Used Percentage: {mg('used_percent', 0):.1f}%\n"
+                f"Health Score: {mg('health_score', 0):.1f}%\n"
+                f"Estimated Age: {mg('estimated_age_years', 0)} years\n"
+                f"Estimated Remaining Life: {mg('estimated_remaining_years', 0):.1f} years\n\n"
+            )
+
+        drives = dd.get('storage')
+        if drives is not None:
+            append("STORAGE ANALYSIS:\n")
+            append(f"{_SEP30}\n")
+            # One f-string per device - a single allocation per block
+            # instead of one per line
+            parts.extend(
+                f"Device: {drive.device}\n"
+                f"  Mount Point: {drive.mountpoint}\n"
+                f"  File System: {drive.filesystem}\n"
+                f"  Total Size: {drive.total_gb:.2f} GB\n"
+                f"  Used: {drive.used_percent:.1f}%\n"
+                f"  Drive Type: {drive.drive_type}\n"
+                f"  Health Score: {drive.health_score:.1f}%\n"
+                f"  Estimated Age: {drive.estimated_age_years} years\n"
+                f"  Est. Remaining Life: {drive.estimated_remaining_years:.1f} years\n\n"
+                for drive in drives
+            )
+            storage_error = dd.get('storage_error')
+            if storage_error:
+                append(f"Error reading storage: {storage_error}\n\n")
+
+        temp_data = dd.get('temperature')
+        if temp_data is not None:
+            append("TEMPERATURE MONITORING:\n")
+            append(f"{_SEP30}\n")
             if temp_data and not temp_data.get('error'):
                 for sensor, data in temp_data.items():
                     if isinstance(data, dict):
-                        report += f"Sensor: {sensor}\n"
-                        report += f"  Current: {data.get('current', 0):.1f}°C\n"
-                        if data.get('high'):
-                            report += f"  High Threshold: {data['high']:.1f}°C\n"
-                        if data.get('critical'):
-                            report += f"  Critical Threshold: {data['critical']:.1f}°C\n"
-                        report += f"  Health Score: {data.get('health_score', 0):.1f}%\n"
-                        report += "\n"
-            else:
-                report += "Temperature sensors not available or accessible\n\n"
-        
-        if 'performance' in self.diagnostic_data:
-            perf_data = self.diagnostic_data['performance']
-            report += "PERFORMANCE ANALYSIS:\n"
-            report += "-" * 30 + "\n"
-            report += f"CPU Usage: {perf_data.get('cpu_usage', 0):.1f}%\n"
-            if perf_data.get('cpu_frequency'):
-                report += f"CPU Frequency: {perf_data['cpu_frequency']:.0f} MHz\n"
-            report += f"CPU Cores: {perf_data.get('cpu_cores', 0)}\n"
-            report += f"Performance Health Score: {perf_data.get('health_score', 0):.1f}%\n"
-            report += "\n"
-        
-        report += "OVERALL ASSESSMENT:\n"
-        report += "-" * 30 + "\n"
-        
-        if self.health_scores:
-            overall_health = sum(self.health_scores.values()) / len(self.health_scores)
-            report += f"Overall System Health: {overall_health:.1f}%\n"
-            
-            if overall_health >= 85:
-                report += "Status: EXCELLENT - System is running optimally\n"
-            elif overall_health >= 70:
-                report += "Status: GOOD - System is healthy with minor issues\n"
-            elif overall_health >= 50:
-                report += "Status: FAIR - Some components need attention\n"
+                        sg = data.get
+                        append(f"Sensor: {sensor}\n"
+                               f"  Current: {sg('current', 0):.1f}°C\n")
+                        high = sg('high')
+                        if high:
+                            append(f"  High Threshold: {high:.1f}°C\n")
+                        critical = sg('critical')
+                        if critical:
+                            append(f"  Critical Threshold: {critical:.1f}°C\n")
+                        append(f"  Health Score: {sg('health_score', 0):.1f}%\n\n")
             else:
-                report += "Status: POOR - Multiple components require immediate attention\n"
-            
-            report += "\nRecommendations:\n"
-            
+                append("Temperature sensors not available or accessible\n\n")
+
+        perf_data = dd.get('performance')
+        if perf_data is not None:
+            pg = perf_data.get
+            append("PERFORMANCE ANALYSIS:\n")
+            append(f"{_SEP30}\n")
+            append(f"CPU Usage: {pg('cpu_usage', 0):.1f}%\n")
+            cpu_frequency = pg('cpu_frequency')
+            if cpu_frequency:
+                append(f"CPU Frequency: {cpu_frequency:.0f} MHz\n")
+            append(f"CPU Cores: {pg('cpu_cores', 0)}\n"
+                   f"Performance Health Score: {pg('health_score', 0):.1f}%\n\n")
+
+        append("OVERALL ASSESSMENT:\n")
+        append(f"{_SEP30}\n")
+
+        if self._summary_cache:
+            overall_health = self._summary_cache['overall_health']
+            status_text, _ = self._summary_cache['status']
+            append(f"Overall System Health: {overall_health:.1f}%\n")
+            append(f"Status: {status_text} - {_STATUS_DESCRIPTIONS[status_text]}\n")
+
+            append("\nRecommendations:\n")
+
             for component, health in self.health_scores.items():
                 if health < 60:
-                    if component == 'battery':
-                        report += f"• Battery: Consider replacement, health at {health:.1f}%\n"
-                    elif component == 'memory':
-                        report += f"• Memory: High usage detected, consider adding RAM\n"
-                    elif component == 'storage':
-                        report += f"• Storage: Check disk space and consider cleanup/upgrade\n"
-                    elif component == 'temperature':
-                        report += f"• Temperature: Check cooling system, clean fans/vents\n"
-                    elif component == 'performance':
-                        report += f"• Performance: High CPU usage, check for resource-heavy processes\n"
-        
-        self.details_text.delete(1.0, tk.END)
-        self.details_text.insert(1.0, report)
+                    rec = _RECS.get(component)
+                    if rec:
+                        append(rec(health))
+
+        # Stream the report into the widget per section instead of one
+        # giant string, with the widget read-only between refreshes
+        self.details_text.configure(state='normal')
+        self.details_text.delete('1.0', tk.END)
+        for chunk in parts:
+            self.details_text.insert(tk.END, chunk)
+        self.details_text.configure(state='disabled')
     
     def update_predictions(self):
         """Update predictions tab"""
-        for item in self.predictions_tree.get_children():
-            self.predictions_tree.delete(item)
-        
-        for component, pred_data in self.predictions.items():
-            if pred_data['risk_level'] == 'HIGH':
-                risk_symbol = "🔴 HIGH"
-            elif pred_data['risk_level'] == 'MEDIUM':
-                risk_symbol = "🟡 MEDIUM"
-            else:
-                risk_symbol = "🟢 LOW"
-            
-            self.predictions_tree.insert('', 'end', text=component,
-                                       values=(pred_data['current_age'],
-                                              pred_data['estimated_lifespan'],
-                                              pred_data['remaining_life'],
-                                              risk_symbol))
+        children = self.predictions_tree.get_children()
+        if children:
+            self.predictions_tree.delete(*children)
+        
+        # Precompute every row before touching the widget, with the risk
+        # symbol resolved by dict lookup rather than a compare chain
+        rows = [(component, (pred_data['current_age'],
+                             pred_data['estimated_lifespan'],
+                             pred_data['remaining_life'],
+                             _RISK.get(pred_data['risk_level'], '🟢 LOW')))
+                for component, pred_data in self.predictions.items()]
+
+        for component, values in rows:
+            self.predictions_tree.insert('', 'end', text=component, values=values)
     
     def update_health_summary(self):
         """Update health summary in control panel"""
-        summary = "HEALTH SUMMARY\n" + "="*20 + "\n\n"
-        
-        if self.health_scores:
-            overall_health = sum(self.health_scores.values()) / len(self.health_scores)
-            
-            if overall_health >= 85:
-                status_emoji = "🟢"
-                status_text = "EXCELLENT"
-            elif overall_health >= 70:
-                status_emoji = "🟡"
-                status_text = "GOOD"
-            elif overall_health >= 50:
-                status_emoji = "🟠"
-                status_text = "FAIR"
-            else:
-                status_emoji = "🔴"
-                status_text = "POOR"
-            
-            summary += f"Overall: {status_emoji} {status_text}\n"
-            summary += f"Score: {overall_health:.1f}%\n\n"
-            
-            for component, health in sorted(self.health_scores.items()):
-                if health >= 80:
-                    emoji = "🟢"
-                elif health >= 60:
-                    emoji = "🟡"
-                else:
-                    emoji = "🔴"
-                
-                summary += f"{emoji} {component.title()}: {health:.0f}%\n"
-            
-            high_risk = sum(1 for pred in self.predictions.values() 
-                          if pred.get('risk_level') == 'HIGH')
+        lines = ["HEALTH SUMMARY", "=" * 20, ""]
+        cache = self._summary_cache
+
+        if cache:
+            status_text, status_emoji = cache['status']
+            lines.append(f"Overall: {status_emoji} {status_text}")
+            lines.append(f"Score: {cache['overall_health']:.1f}%")
+            lines.append("")
+
+            components = cache['sorted_components']
+            healths = np.fromiter((health for _, health in components),
+                                  dtype=np.float64, count=len(components))
+            emojis = np.asarray(_COMPONENT_EMOJI)[
+                np.searchsorted(_COMPONENT_THRESHOLDS, healths, side='right')]
+
+            for (component, health), emoji in zip(components, emojis):
+                lines.append(f"{emoji} {component.title():<12}{health:>4.0f}%")
+
+            high_risk = cache['high_risk']
             if high_risk > 0:
-                summary += f"\n⚠️  {high_risk} component(s) at high failure risk"
-        
+                lines.append("")
+                lines.append(f"⚠️  {high_risk} component(s) at high failure risk")
+
+        # One join + one insert - no per-line Tcl round-trips
         self.health_text.delete(1.0, tk.END)
-        self.health_text.insert(1.0, summary)
+        self.health_text.insert(1.0, "\n".join(lines))
 
 def install_dependencies():
     """Check and install required dependencies"""
-    required_packages = ['psutil', 'matplotlib']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
-    
+    required_packages = ['psutil', 'matplotlib', 'numpy']
+
+    # find_spec only reads package metadata - unlike __import__ it does
+    # not execute module init code (matplotlib's alone takes hundreds of
+    # ms) just to check presence
+    missing_packages = [package for package in required_packages
+                        if importlib.util.find_spec(package) is None]
+
     if missing_packages:
         print(f"Installing required packages: {', '.join(missing_packages)}")
         try:
@@ -932,6 +1439,12 @@ def install_dependencies():
             return False
     return True
 
+def center_window(root):
+    """Center the window on screen, keeping its current size"""
+    x = (root.winfo_screenwidth() - root.winfo_width()) // 2
+    y = (root.winfo_screenheight() - root.winfo_height()) // 2
+    root.geometry(f'+{x}+{y}')
+
 def main():
     """Main function to run the application"""
     print("Advanced PC Hardware Diagnostic Tool with GUI")
@@ -945,13 +1458,10 @@ def main():
         root = tk.Tk()
         app = AdvancedDiagnosticGUI(root)
         
-        root.update_idletasks()
-        width = root.winfo_width()
-        height = root.winfo_height()
-        x = (root.winfo_screenwidth() // 2) - (width // 2)
-        y = (root.winfo_screenheight() // 2) - (height // 2)
-        root.geometry(f'{width}x{height}+{x}+{y}')
-        
+        # Center once the event loop has done the initial layout rather
+        # than forcing a synchronous realization pass before mainloop
+        root.after_idle(lambda: center_window(root))
+
         print("Starting GUI application...")
         root.mainloop()
         